@@ -22,7 +22,10 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 '''
 
-import datetime
+from typing import TYPE_CHECKING, Any, Tuple
+
+if TYPE_CHECKING:
+    import datetime
 
 
 __all__ = ('BaseMessage',)
@@ -36,6 +39,10 @@ class BaseMessage:
     - :class:`.Message`
     - :class:`.SystemMessage`
 
+    Messages are immutable: their attributes can not be assigned or
+    deleted once the message is created. This allows messages to be hashed and
+    used as :class:`dict` keys or :class:`set` members.
+
     Attributes
     ----------
     content: :class:`str`
@@ -44,7 +51,43 @@ class BaseMessage:
         The message's creation time.
     """
 
-    __slots__ = ()
+    __slots__ = ('content', 'created_at', '_hash')
 
     content: str
-    created_at: datetime.datetime
+    created_at: 'datetime.datetime'
+
+    def __init__(
+        self,
+        content: str,
+        created_at: 'datetime.datetime'
+    ) -> None:
+        # Attributes are written with :meth:`object.__setattr__`, since
+        # :meth:`__setattr__` always raises.
+        object.__setattr__(self, 'content', content)
+        object.__setattr__(self, 'created_at', created_at)
+
+        # The hash is computed only once since the message can not be
+        # modified after its creation.
+        object.__setattr__(self, '_hash', hash(self._key()))
+
+    def _key(self) -> Tuple[Any, ...]:
+        return (self.content, self.created_at)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f'{name!r} attribute is read-only')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f'{name!r} attribute is read-only')
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, BaseMessage):
+            return NotImplemented
+
+        return (
+            type(self) is type(other) and
+            self._hash == other._hash and
+            self._key() == other._key()
+        )
+
+    def __hash__(self) -> int:
+        return self._hash
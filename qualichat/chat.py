@@ -22,20 +22,23 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 '''
 
+import datetime
 import pathlib
 import json
 import os
 import random
-from typing import List, Union, Dict, Any
+from typing import List, Union, Dict, Any, Optional
 
 from colorama import Fore
+from pandas import DataFrame, to_datetime
+from pandas.core.groupby import DataFrameGroupBy
 
 from .utils import log
 from .regex import CHAT_RE, USER_MESSAGE_RE
 from .models import Actor, Message, SystemMessage
 
 
-__all__ = ('Chat',)
+__all__ = ('Chat', 'get_month_name')
 
 
 def _clean_impurities(text: str) -> str:
@@ -52,6 +55,35 @@ def _clean_impurities(text: str) -> str:
     return text
 
 
+# The message data whose lengths are available in :meth:`Chat.to_frame`.
+LENGTH_FIELDS = [
+    'Qty_char_net', 'Qty_char_text',
+    'Qty_char_laughs', 'Qty_char_marks',
+    'Qty_char_emoji', 'Qty_char_numbers',
+    'Qty_char_links', 'Qty_char_emails',
+    'Qty_char_mentions', 'Qty_char_!',
+    'Qty_char_?'
+]
+
+
+def get_month_name(month: int) -> str:
+    """Converts a month from the ``month`` column of
+    :meth:`Chat.to_frame` to its name.
+
+    Parameters
+    ----------
+    month: :class:`int`
+        The month, as ``year * 12 + month - 1``.
+
+    Returns
+    -------
+    :class:`str`
+        The month name, e.g. ``'January 2021'``.
+    """
+    year, month = divmod(month, 12)
+    return datetime.date(year, month + 1, 1).strftime('%B %Y')
+
+
 def _get_config_file() -> Dict[Any, Any]:
     home = pathlib.Path.home()
     qualichat_folder = home / '.qualichat'
@@ -111,7 +143,10 @@ class Chat:
         All the system messages found by Qualichat.
     """
 
-    __slots__ = ('filename', 'messages', 'system_messages', '_actors')
+    __slots__ = (
+        'filename', 'messages', 'system_messages',
+        '_actors', '_frame', '_groups'
+    )
 
     def __init__(self, path: Union[str, pathlib.Path], **kwargs: str) -> None:
         if not isinstance(path, pathlib.Path):
@@ -134,6 +169,8 @@ class Chat:
         self.system_messages: List[SystemMessage] = []
 
         self._actors: Dict[str, Actor] = {}
+        self._frame: Optional[DataFrame] = None
+        self._groups: Dict[str, DataFrameGroupBy] = {}
 
         log('info', f'Contents of file {name} cleaned. Parsing it.')
         for match in CHAT_RE.finditer(raw_data):
@@ -191,3 +228,99 @@ class Chat:
         chat.
         """
         return list(self._actors.values())
+
+    def to_frame(self) -> DataFrame:
+        """Returns the actor messages of the chat as a
+        :class:`pandas.DataFrame`, with one row per message.
+
+        The frame is built only once and then cached, so it should not
+        be modified in place.
+
+        These are the columns currently available:
+
+        - ``created_at``: The message's creation time.
+        - ``timestamp``: The message's creation time as seconds since
+          the epoch, taking the chat's time as UTC. Cheaper to compare
+          and subtract than ``created_at``.
+        - ``actor``: The position of the message's actor in
+          :attr:`actors`.
+        - ``month``: The month the message was sent, as
+          ``year * 12 + month - 1``. This keeps months sortable and
+          cheap to group, see :func:`get_month_name` to get its name.
+        - ``weekday``: The weekday the message was sent, from ``0``
+          (Sunday) to ``6`` (Saturday).
+        - ``Day_period``: The value of the message's :class:`.Period`.
+        - ``Day_sub_period``: The value of the message's
+          :class:`.SubPeriod`.
+        - ``Qty_char_*``: The number of characters of each
+          ``Qty_char_*`` data of the message, e.g.
+          ``Qty_char_laughs``.
+        - ``emojis``: The number of emojis in the message.
+
+        Returns
+        -------
+        :class:`pandas.DataFrame`
+            The messages of the chat.
+        """
+        if self._frame is not None:
+            return self._frame
+
+        data: Dict[str, List[Any]] = {
+            'created_at': [],
+            'actor': [],
+            'Day_period': [],
+            'Day_sub_period': [],
+            'emojis': []
+        }
+        data.update((field, []) for field in LENGTH_FIELDS)
+
+        actors = {actor: i for i, actor in enumerate(self._actors.values())}
+
+        for message in self.messages:
+            data['created_at'].append(message.created_at)
+            data['actor'].append(actors[message.actor])
+            data['Day_period'].append(message['Day_period'].value)
+            data['Day_sub_period'].append(message['Day_sub_period'].value)
+            data['emojis'].append(len(message['Qty_char_emoji']))
+
+            for field in LENGTH_FIELDS:
+                data[field].append(message.length(field))
+
+        dtypes = dict.fromkeys(['actor', *LENGTH_FIELDS], 'int64')
+        # Emoji counts are small, so they are stored in narrower
+        # integers to keep the frame compact.
+        dtypes['emojis'] = 'uint32'
+        frame = DataFrame(data).astype(dtypes)
+        created_at = to_datetime(frame['created_at'])
+
+        frame['created_at'] = created_at
+        seconds = created_at.to_numpy().astype('datetime64[s]')
+        frame.insert(1, 'timestamp', seconds.astype('int64'))
+        frame['month'] = created_at.dt.year * 12 + created_at.dt.month - 1
+        # pandas starts the week on Monday, while Qualichat starts
+        # it on Sunday.
+        frame['weekday'] = (created_at.dt.weekday + 1) % 7
+
+        self._frame = frame
+        return frame
+
+    def groupby(self, key: str) -> DataFrameGroupBy:
+        """Groups the rows of :meth:`to_frame` by the given column.
+
+        The grouping is computed only once per column and then cached,
+        so every feature grouping by the same column shares it.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The column to group by, e.g. ``'month'``.
+
+        Returns
+        -------
+        :class:`pandas.core.groupby.DataFrameGroupBy`
+            The grouped messages, sorted by the given column.
+        """
+        if key not in self._groups:
+            self._groups[key] = self.to_frame().groupby(key) # type: ignore
+
+        return self._groups[key]
@@ -23,7 +23,7 @@ SOFTWARE.
 '''
 
 import pathlib
-from typing import Union, List, Any
+from typing import Union, List, Dict, Any
 
 from .chat import Chat
 from .features import (
@@ -64,8 +64,12 @@ class Qualichat:
         self.messages = MessagesFeature(chats)
         self.actors = ActorsFeature(chats)
         self.time = TimeFeature(chats)
-        self.nouns = NounsFeature(chats)
-        self.verbs = VerbsFeature(chats)
+
+        # The nouns and verbs features share their word counts, so
+        # each chat is only tagged once.
+        frequencies: Dict[Chat, Dict[str, Dict[str, int]]] = {}
+        self.nouns = NounsFeature(chats, frequencies)
+        self.verbs = VerbsFeature(chats, frequencies)
         self.emojis = EmojisFeature(chats)
 
 
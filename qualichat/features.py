@@ -23,32 +23,36 @@ SOFTWARE.
 '''
 
 from typing import (
+    TYPE_CHECKING,
     List,
-    DefaultDict,
     Callable,
     Any,
     Optional,
     Dict,
     Union,
-    Set
+    Set,
+    Tuple,
+    Iterable
 )
-from collections import defaultdict
+import functools
+import operator
+import os
+from collections import Counter
 
+import numpy as np
 import spacy
-import matplotlib.pyplot as plt
 import plotly.graph_objects as go # type: ignore
-from pandas import DataFrame
+from pandas import DataFrame, Categorical
 from pandas.core.generic import NDFrame
-from wordcloud import ( # type: ignore
-    STOPWORDS,
-    WordCloud
-)
 from plotly.subplots import make_subplots # type: ignore
 
-from .chat import Chat
+from .chat import Chat, LENGTH_FIELDS, get_month_name
 from .models import Message
 from .enums import Period, SubPeriod, MessageType
-from .utils import progress_bar
+from .utils import log, progress_bar
+
+if TYPE_CHECKING:
+    from wordcloud import WordCloud # type: ignore
 
 
 __all__ = (
@@ -81,11 +85,11 @@ def generate_chart(
     title: Optional[:class:`str`]
         The title of the chart. Defaults to ``None``.
     """
-    if bars is None:
-        bars = []
-
-    if lines is None:
-        lines = []
+    # The columns are frozen here, so the chart is not affected if the
+    # given lists are modified later.
+    bar_columns: Tuple[str, ...] = tuple(bars or ())
+    line_columns: Tuple[str, ...] = tuple(lines or ())
+    secondary_y = bool(bar_columns)
 
     def decorator(
         method: Callable[..., Union[DataFrame, NDFrame]]
@@ -101,25 +105,26 @@ def generate_chart(
             dataframe = method(self, *args, **kwargs)
 
             index = dataframe.index # type: ignore
-
-            if bars is not None:
-                for bar in bars:
-                    filtered = getattr(dataframe, bar)
-                    fig.add_bar( # type: ignore
-                        x=index,
-                        y=list(filtered),
-                        name=bar
-                    )
-
-            if lines is not None:
-                for line in lines:
-                    filtered = getattr(dataframe, line)
-                    fig.add_trace( # type: ignore
-                        go.Scatter( # type: ignore
-                            x=index, y=list(filtered), name=line
-                        ),
-                        secondary_y=bool(bars),
-                    )
+            add_bar = fig.add_bar # type: ignore
+            add_trace = fig.add_trace # type: ignore
+
+            # The columns are selected all at once, so each trace is
+            # just a view of the same array.
+            bar_frame = dataframe[list(bar_columns)] # type: ignore
+            line_frame = dataframe[list(line_columns)] # type: ignore
+            bar_values = bar_frame.to_numpy() # type: ignore
+            line_values = line_frame.to_numpy() # type: ignore
+
+            for i, bar in enumerate(bar_columns):
+                add_bar(x=index, y=bar_values[:, i], name=bar)
+
+            for i, line in enumerate(line_columns):
+                add_trace(
+                    go.Scatter( # type: ignore
+                        x=index, y=line_values[:, i], name=line
+                    ),
+                    secondary_y=secondary_y,
+                )
 
             fig.update_layout(title_text=title) # type: ignore
             fig.show() # type: ignore
@@ -133,18 +138,32 @@ def generate_chart(
     return decorator
 
 
-stopwords: Set[str] = set(STOPWORDS) # type: ignore
-stopwords.update(['da', 'meu', 'em', 'você', 'de', 'ao', 'os', 'eu'])
+# The word cloud dependencies (and matplotlib) are only imported when a
+# word cloud is first generated, since they are slow to import and
+# the other features do not need them.
+@functools.lru_cache(maxsize=None)
+def _get_stopwords() -> Set[str]:
+    from wordcloud import STOPWORDS # type: ignore
+
+    stopwords: Set[str] = set(STOPWORDS) # type: ignore
+    stopwords.update(['da', 'meu', 'em', 'você', 'de', 'ao', 'os', 'eu'])
+    return stopwords
+
+
+def _get_word_cloud(frequencies: Dict[str, int]) -> 'WordCloud':
+    from wordcloud import WordCloud # type: ignore
+    return WordCloud().generate_from_frequencies(frequencies) # type: ignore
 
 
 def generate_word_cloud(): # type: ignore
     """A decorator that generates a word cloud automatically."""
     def decorator(
-        method: Callable[..., WordCloud] # type: ignore
+        method: Callable[..., 'WordCloud'] # type: ignore
     ) -> Callable[..., None]:
         def generator(self: BaseFeature, *args: Any, **kwargs: Any) -> None:
+            import matplotlib.pyplot as plt
+
             wordcloud = method(self, *args, **kwargs) # type: ignore
-            wordcloud.stopwords = stopwords
 
             plt.figure()
             plt.imshow(wordcloud, interpolation='bilinear') # type: ignore
@@ -160,10 +179,6 @@ def generate_word_cloud(): # type: ignore
     return decorator # type: ignore
 
 
-def get_length(obj: List[str]) -> int:
-    return len(''.join(obj))
-
-
 WEEKDAYS = [
     'Sunday', 'Monday',
     'Tuesday', 'Wednesday',
@@ -174,6 +189,94 @@ PERIODS = [c.value for c in Period]
 SUB_PERIODS = [c.value for c in SubPeriod]
 
 
+def _name_index(dataframe: DataFrame, key: str) -> DataFrame:
+    # Months and weekdays are grouped (and sorted) by their integer
+    # keys, only the resulting groups are converted to their names.
+    if key == 'month':
+        dataframe.index = dataframe.index.map(get_month_name) # type: ignore
+    elif key == 'weekday':
+        dataframe = dataframe.reindex(range(7), fill_value=0)
+        dataframe.index = WEEKDAYS # type: ignore
+
+    return dataframe
+
+
+def _sum_by(chat: Chat, key: str, columns: List[str]) -> DataFrame:
+    grouped = chat.groupby(key)
+
+    dataframe: DataFrame = grouped[columns].sum() # type: ignore
+    dataframe['Qty_messages'] = grouped.size() # type: ignore
+
+    return _name_index(dataframe, key)
+
+
+def _count_by(
+    chat: Chat,
+    key: str,
+    column: str,
+    categories: Iterable[Any]
+) -> DataFrame:
+    grouped = chat.groupby(key)
+    groups = grouped.ngroups # type: ignore
+
+    categories = list(categories)
+    size = len(categories)
+
+    # Every (group, category) pair gets its own bin, so all of them are
+    # counted at once.
+    codes = Categorical(
+        chat.to_frame()[column], categories=categories
+    ).codes
+    bins = grouped.ngroup().to_numpy() * size + codes # type: ignore
+
+    counts = np.bincount(bins, minlength=groups * size)
+    dataframe = DataFrame(
+        counts.reshape(groups, size),
+        index=grouped.size().index, # type: ignore
+        columns=categories
+    )
+
+    return _name_index(dataframe, key)
+
+
+INTERACTIONS = [
+    'Super Fast Interactions', 'Fast Interactions',
+    'Regular Interactions', 'Late Interactions'
+]
+
+# The upper bounds (in seconds) of the super fast, fast and regular
+# interaction ranges. Anything above them is a late interaction.
+INTERACTION_BOUNDS = np.array([30, 60, 120])
+
+
+def _get_interaction_ranges(deltas: np.ndarray) -> np.ndarray:
+    # Maps each interval to its range, from 0 (super fast) to 3 (late).
+    return np.searchsorted(INTERACTION_BOUNDS, deltas, side='left')
+
+
+def _count_interactions_by(chat: Chat, key: str) -> DataFrame:
+    grouped = chat.groupby(key)
+    groups = grouped.ngroups # type: ignore
+
+    # Each message is compared with the previous message of its own
+    # group, so the first message of each group is skipped.
+    deltas = grouped['timestamp'].diff().to_numpy() # type: ignore
+    has_previous = ~np.isnan(deltas)
+
+    ranges = _get_interaction_ranges(deltas[has_previous])
+    codes = grouped.ngroup().to_numpy()[has_previous] # type: ignore
+
+    counts = np.bincount(codes * 4 + ranges, minlength=groups * 4)
+    dataframe = DataFrame(
+        counts.reshape(groups, 4),
+        index=grouped.size().index, # type: ignore
+        columns=INTERACTIONS
+    )
+    dataframe['Qty_messages'] = grouped.size() # type: ignore
+
+    return _name_index(dataframe, key)
+
+
 class BaseFeature:
     """Represents the base of a Qualichat feature.
     Generally, you should use the built-in features that Qualichat
@@ -211,7 +314,20 @@ class MessagesFeature(BaseFeature):
         All the chats loaded via :meth:`qualichat.load_chats`.
     """
 
-    __slots__ = ()
+    __slots__ = ('_aggregates',)
+
+    def __init__(self, chats: List[Chat]) -> None:
+        super().__init__(chats)
+        self._aggregates: Dict[str, DataFrame] = {}
+
+    def _aggregate(self, key: str) -> DataFrame:
+        # All the lengths are summed at once, so every chart grouped
+        # by the same key is just a selection of columns.
+        if key not in self._aggregates:
+            chat = self.chats[0]
+            self._aggregates[key] = _sum_by(chat, key, LENGTH_FIELDS)
+
+        return self._aggregates[key]
 
     @generate_chart(
         bars=['Qty_char_net', 'Qty_char_text'],
@@ -220,33 +336,9 @@ class MessagesFeature(BaseFeature):
     )
     def per_month(self) -> DataFrame:
         """Shows how many messages were sent per month."""
-        chat = self.chats[0]
-        data: DefaultDict[str, List[Message]] = defaultdict(list)
-
         columns = ['Qty_char_net', 'Qty_char_text', 'Qty_messages']
-        rows: List[List[int]] = []
-
-        for message in chat.messages:
-            index = message.created_at.replace(
-                day=1, hour=0, minute=0, second=0
-            )
-            data[index.strftime('%B %Y')].append(message)
-
-        index = list(data.keys())
-
-        for messages in data.values():
-            net_content = 0
-            pure_content = 0
-            total_messages = 0
-
-            for message in messages:
-                net_content += len(message['Qty_char_net'])
-                pure_content += len(message['Qty_char_text'])
-                total_messages += 1
 
-            rows.append([net_content, pure_content, total_messages])
-
-        return DataFrame(rows, index=index, columns=columns)
+        return self._aggregate('month')[columns]
 
     @generate_chart(
         bars=WEEKDAYS,
@@ -258,29 +350,12 @@ class MessagesFeature(BaseFeature):
         month.
         """
         chat = self.chats[0]
-        data: DefaultDict[str, List[Message]] = defaultdict(list)
-
-        columns = WEEKDAYS.copy()
-        columns.append('Qty_char_net')
-        rows: List[List[int]] = []
-
-        for message in chat.messages:
-            index = message.created_at.replace(hour=0, minute=0, second=0)
-            data[index.strftime('%B %Y')].append(message)
-
-        index = list(data.keys())
 
-        for messages in data.values():
-            weekdays = {w: 0 for w in WEEKDAYS}
-            net_content = 0
+        dataframe = _count_by(chat, 'month', 'weekday', range(7))
+        dataframe.columns = WEEKDAYS # type: ignore
+        dataframe['Qty_char_net'] = self._aggregate('month')['Qty_char_net']
 
-            for message in messages:
-                weekdays[message.created_at.strftime('%A')] += 1
-                net_content += len(message['Qty_char_net'])
-
-            rows.append([*weekdays.values(), net_content])
-
-        return DataFrame(rows, index=index, columns=columns)
+        return dataframe
 
     @generate_chart(
         bars=['Qty_char_net', 'Qty_char_text'],
@@ -292,31 +367,9 @@ class MessagesFeature(BaseFeature):
         between this method and :meth:`.weekdays_per_month` is that
         this method groups every month.
         """
-        chat = self.chats[0]
-        data: Dict[str, List[Message]] = {w: [] for w in WEEKDAYS}
-
         columns = ['Qty_char_net', 'Qty_char_text', 'Qty_messages']
-        rows: List[List[int]] = []
-
-        for message in chat.messages:
-            index = message.created_at.replace(hour=0, minute=0, second=0)
-            data[index.strftime('%A')].append(message)
-
-        index = list(data.keys())
-
-        for messages in data.values():
-            net_content = 0
-            text_content = 0
-            total_messages = 0
 
-            for message in messages:
-                net_content += len(message['Qty_char_net'])
-                text_content += len(message['Qty_char_text'])
-                total_messages += 1
-
-            rows.append([net_content, text_content, total_messages])
-
-        return DataFrame(rows, index=index, columns=columns)
+        return self._aggregate('weekday')[columns]
 
     @generate_chart(
         bars=[
@@ -339,41 +392,13 @@ class MessagesFeature(BaseFeature):
         
         And it will be compared with the total messages sent per month.
         """
-        chat = self.chats[0]
-        data: DefaultDict[str, List[Message]] = defaultdict(list)
-
         columns = [
             'Qty_char_laughs', 'Qty_char_marks',
             'Qty_char_emoji', 'Qty_char_numbers',
             'Qty_messages'
         ]
-        rows: List[List[int]] = []
-
-        for message in chat.messages:
-            index = message.created_at.replace(
-                day=1, hour=0, minute=0, second=0
-            )
-            data[index.strftime('%B %Y')].append(message)
-
-        index = list(data.keys())
-
-        for messages in data.values():
-            laughs = 0
-            marks = 0
-            emojis = 0
-            numbers = 0
-            total_messages = 0
-
-            for message in messages:
-                laughs += get_length(message['Qty_char_laughs'])
-                marks += get_length(message['Qty_char_marks'])
-                emojis += get_length(message['Qty_char_emoji'])
-                numbers += get_length(message['Qty_char_numbers'])
-                total_messages += 1
-
-            rows.append([laughs, marks, emojis, numbers, total_messages])
 
-        return DataFrame(rows, index=index, columns=columns)
+        return self._aggregate('month')[columns]
 
     @generate_chart(
         bars=['Qty_char_links', 'Qty_char_emails', 'Qty_char_mentions'],
@@ -392,36 +417,12 @@ class MessagesFeature(BaseFeature):
 
         And it will be compared with the total messages sent per month.
         """
-        chat = self.chats[0]
-        data: DefaultDict[str, List[Message]] = defaultdict(list)
-
         columns = [
             'Qty_char_links', 'Qty_char_emails',
             'Qty_char_mentions', 'Qty_messages'
         ]
-        rows: List[List[int]] = []
-
-        for message in chat.messages:
-            index = message.created_at.replace(hour=0, minute=0, second=0)
-            data[index.strftime('%B %Y')].append(message)
-
-        index = list(data.keys())
-
-        for messages in data.values():
-            links = 0
-            emails = 0
-            mentions = 0
-            total_messages = 0
-
-            for message in messages:
-                links += get_length(message['Qty_char_links'])
-                emails += get_length(message['Qty_char_emails'])
-                mentions += get_length(message['Qty_char_mentions'])
-                total_messages += 1
-
-            rows.append([links, emails, mentions, total_messages])
 
-        return DataFrame(rows, index=index, columns=columns)
+        return self._aggregate('month')[columns]
 
     @generate_chart(
         bars=PERIODS,
@@ -441,32 +442,11 @@ class MessagesFeature(BaseFeature):
         For more information, see :class:`.Period`.
         """
         chat = self.chats[0]
-        data: DefaultDict[str, List[Message]] = defaultdict(list)
-
-        columns = PERIODS.copy()
-        columns.append('Qty_messages')
-
-        rows: List[List[int]] = []
-
-        for message in chat.messages:
-            index = message.created_at.replace(
-                day=1, hour=0, minute=0, second=0
-            )
-            data[index.strftime('%B %Y')].append(message)
-
-        index = list(data.keys())
-
-        for messages in data.values():
-            periods = {v: 0 for v in PERIODS}
-            total_messages = 0
-
-            for message in messages:
-                periods[message['Day_period'].value] += 1
-                total_messages += 1
 
-            rows.append([*periods.values(), total_messages])
+        dataframe = _count_by(chat, 'month', 'Day_period', PERIODS)
+        dataframe['Qty_messages'] = self._aggregate('month')['Qty_messages']
 
-        return DataFrame(rows, index=index, columns=columns)
+        return dataframe
 
     @generate_chart(
         bars=SUB_PERIODS,
@@ -489,32 +469,11 @@ class MessagesFeature(BaseFeature):
         For more information, see :class:`.SubPeriod`.
         """
         chat = self.chats[0]
-        data: DefaultDict[str, List[Message]] = defaultdict(list)
 
-        columns = SUB_PERIODS.copy()
-        columns.append('Qty_messages')
+        dataframe = _count_by(chat, 'month', 'Day_sub_period', SUB_PERIODS)
+        dataframe['Qty_messages'] = self._aggregate('month')['Qty_messages']
 
-        rows: List[List[int]] = []
-
-        for message in chat.messages:
-            index = message.created_at.replace(
-                day=1, hour=0, minute=0, second=0
-            )
-            data[index.strftime('%B %Y')].append(message)
-
-        index = list(data.keys())
-
-        for messages in data.values():
-            sub_periods = {v: 0 for v in SUB_PERIODS}
-            total_messages = 0
-
-            for message in messages:
-                sub_periods[message['Day_sub_period'].value] += 1
-                total_messages += 1
-
-            rows.append([*sub_periods.values(), total_messages])
-
-        return DataFrame(rows, index=index, columns=columns)
+        return dataframe
 
     @generate_chart(
         bars=['Qty_char_!', 'Qty_char_?'],
@@ -530,39 +489,12 @@ class MessagesFeature(BaseFeature):
         - ``!``
         - ``?``
         """
-        chat = self.chats[0]
-        data: DefaultDict[str, List[Message]] = defaultdict(list)
-
         columns = [
             'Qty_char_!', 'Qty_char_?',
             'Qty_char_text', 'Qty_messages'
         ]
-        rows: List[List[int]] = []
-
-        for message in chat.messages:
-            index = message.created_at.replace(hour=0, minute=0, second=0)
-            data[index.strftime('%B %Y')].append(message)
-
-        index = list(data.keys())
-
-        for messages in data.values():
-            exclamation_marks = 0
-            question_marks = 0
-            text_content = 0
-            total_messages = 0
-
-            for message in messages:
-                exclamation_marks += get_length(message['Qty_char_!'])
-                question_marks += get_length(message['Qty_char_?'])
-                text_content += len(message['Qty_char_text'])
-                total_messages += 1
-
-            rows.append([
-                exclamation_marks, question_marks,
-                text_content, total_messages
-            ])
 
-        return DataFrame(rows, index=index, columns=columns)
+        return self._aggregate('month')[columns]
 
 
 class ActorsFeature(BaseFeature):
@@ -578,7 +510,26 @@ class ActorsFeature(BaseFeature):
         All the chats loaded via :meth:`qualichat.load_chats`.
     """
 
-    __slots__ = ()
+    __slots__ = ('_totals',)
+
+    def __init__(self, chats: List[Chat]) -> None:
+        super().__init__(chats)
+        self._totals: Optional[DataFrame] = None
+
+    def _aggregate(self) -> DataFrame:
+        # The totals of every actor are summed at once and shared by
+        # all the charts.
+        if self._totals is None:
+            chat = self.chats[0]
+
+            names = [actor.display_name for actor in chat.actors]
+
+            dataframe = _sum_by(chat, 'actor', LENGTH_FIELDS)
+            dataframe.index = names # type: ignore
+
+            self._totals = dataframe
+
+        return self._totals
 
     @generate_chart(
         bars=[
@@ -601,33 +552,14 @@ class ActorsFeature(BaseFeature):
         
         And it will be compared with the total messages sent per actor.
         """
-        chat = self.chats[0]
-
         columns = [
             'Qty_char_numbers', 'Qty_char_emoji',
             'Qty_char_marks', 'Qty_char_laughs',
             'Qty_messages'
         ]
 
-        index = [actor.display_name for actor in chat.actors]
-        rows: List[List[int]] = []
-
-        for actor in chat.actors:
-            numbers = 0
-            emojis = 0
-            marks = 0
-            laughs = 0
-
-            for message in actor.messages:
-                numbers += get_length(message['Qty_char_numbers'])
-                laughs += get_length(message['Qty_char_laughs'])
-                marks += get_length(message['Qty_char_marks'])
-                emojis += get_length(message['Qty_char_emoji'])
-
-            rows.append([numbers, laughs, marks, emojis, len(actor.messages)])
-
-        dataframe = DataFrame(rows, index=index, columns=columns)
-        return dataframe.sort_values(by=columns, ascending=False)[start:end]
+        dataframe = self._aggregate()[columns]
+        return dataframe.nlargest(end, columns).iloc[start:] # type: ignore
 
     @generate_chart(
         bars=['Qty_char_links', 'Qty_char_emails', 'Qty_char_mentions'],
@@ -646,32 +578,13 @@ class ActorsFeature(BaseFeature):
 
         And it will be compared with the total messages sent per actor.
         """
-        chat = self.chats[0]
-
         columns = [
             'Qty_char_links', 'Qty_char_emails',
             'Qty_char_mentions', 'Qty_messages'
         ]
 
-        index = [actor.display_name for actor in chat.actors]
-        rows: List[List[int]] = []
-
-        for actor in chat.actors:
-            links = 0
-            emails = 0
-            mentions = 0
-            total_messages = 0
-
-            for message in actor.messages:
-                links += get_length(message['Qty_char_links'])
-                emails += get_length(message['Qty_char_emails'])
-                mentions += get_length(message['Qty_char_mentions'])
-                total_messages += 1
-
-            rows.append([links, emails, mentions, total_messages])
-
-        dataframe = DataFrame(rows, index=index, columns=columns)
-        return dataframe.sort_values(by=columns, ascending=False)[start:end]
+        dataframe = self._aggregate()[columns]
+        return dataframe.nlargest(end, columns).iloc[start:] # type: ignore
 
     @generate_chart(
         bars=['Qty_char_net', 'Qty_char_text'],
@@ -680,25 +593,10 @@ class ActorsFeature(BaseFeature):
     )
     def by_activity(self, *, start: int = 0, end: int = 10) -> NDFrame:
         """Shows which actor send the most characters in the chat."""
-        chat = self.chats[0]
-
         columns = ['Qty_char_net', 'Qty_char_text', 'Qty_messages']
 
-        index = [actor.display_name for actor in chat.actors]
-        rows: List[List[int]] = []
-
-        for actor in chat.actors:
-            net_content = 0
-            text_content = 0
-
-            for message in actor.messages:
-                net_content += len(message['Qty_char_net'])
-                text_content += len(message['Qty_char_text'])
-
-            rows.append([net_content, text_content, len(actor.messages)])
-
-        dataframe = DataFrame(rows, index=index, columns=columns)
-        return dataframe.sort_values(by=columns, ascending=False)[start:end]
+        dataframe = self._aggregate()[columns]
+        return dataframe.nlargest(end, columns).iloc[start:] # type: ignore
 
     @generate_chart(
         bars=['Qty_char_!', 'Qty_char_?'],
@@ -716,27 +614,10 @@ class ActorsFeature(BaseFeature):
         - ``!``
         - ``?``
         """
-        chat = self.chats[0]
-
         columns = ['Qty_char_!', 'Qty_char_?', 'Qty_messages']
-        index = [actor.display_name for actor in chat.actors]
-
-        rows: List[List[int]] = []
-
-        for actor in chat.actors:
-            exclamation_marks = 0
-            question_marks = 0
-            total_messages = 0
-
-            for message in actor.messages:
-                exclamation_marks += get_length(message['Qty_char_!'])
-                question_marks += get_length(message['Qty_char_?'])
-                total_messages += 1
 
-            rows.append([exclamation_marks, question_marks, total_messages])
-
-        dataframe = DataFrame(rows, index=index, columns=columns)
-        return dataframe.sort_values(by=columns, ascending=False)[start:end]
+        dataframe = self._aggregate()[columns]
+        return dataframe.nlargest(end, columns).iloc[start:] # type: ignore
 
     @generate_chart(
         bars=[
@@ -769,43 +650,22 @@ class ActorsFeature(BaseFeature):
             'Qty_messages'
         ]
 
-        rows: List[List[int]] = []
         index = [actor.display_name for actor in chat.actors]
 
-        for actor in chat.actors:
-            super_fast_interactions = 0
-            fast_interactions = 0
-            regular_interactions = 0
-            late_interactions = 0
-
-            for i, message in enumerate(chat.messages[1:]):
-                if message.actor != actor:
-                    continue
-
-                previous = chat.messages[i]
-
-                delta = message.created_at - previous.created_at
-                seconds = delta.total_seconds()
-
-                if seconds <= 30:
-                    super_fast_interactions += 1
-                elif 30 < seconds <= 60:
-                    fast_interactions += 1
-                elif 60 < seconds <= 120:
-                    regular_interactions += 1
-                else:
-                    late_interactions += 1
-
-            rows.append([
-                super_fast_interactions,
-                fast_interactions,
-                regular_interactions,
-                late_interactions,
-                len(actor.messages)
-            ])
+        # Each message (but the first) is compared with the message
+        # right before it, regardless of who sent it.
+        frame = chat.to_frame()
+        ranges = _get_interaction_ranges(np.diff(frame['timestamp']))
+        actors = frame['actor'].to_numpy()
+
+        counts = np.zeros((len(index), 4), dtype=np.int64)
+        np.add.at(counts, (actors[1:], ranges), 1) # type: ignore
+
+        messages = np.bincount(actors, minlength=len(index))
+        rows = np.column_stack([counts, messages])
 
         dataframe = DataFrame(rows, index=index, columns=columns)
-        return dataframe.sort_values(by=columns, ascending=False)[start:end]
+        return dataframe.nlargest(end, columns).iloc[start:] # type: ignore
 
 
 class TimeFeature(BaseFeature):
@@ -825,32 +685,14 @@ class TimeFeature(BaseFeature):
 
     @staticmethod
     def get_interation_timings(messages: List[Message]) -> List[int]:
-        super_fast_interactions = 0
-        fast_interactions = 0
-        regular_interactions = 0
-        late_interactions = 0
-
-        for i, message in enumerate(messages[1:]):
-            previous = messages[i]
-
-            delta = message.created_at - previous.created_at
-            seconds = delta.total_seconds()
-
-            if seconds <= 30:
-                super_fast_interactions += 1
-            elif 30 < seconds <= 60:
-                fast_interactions += 1
-            elif 60 < seconds <= 120:
-                regular_interactions += 1
-            else:
-                late_interactions += 1
-
-        return [
-            super_fast_interactions,
-            fast_interactions,
-            regular_interactions,
-            late_interactions
-        ]
+        created_at = np.array(
+            [message.created_at for message in messages],
+            dtype='datetime64[s]'
+        )
+        deltas = np.diff(created_at).astype(np.int64)
+        ranges = _get_interaction_ranges(deltas)
+
+        return np.bincount(ranges, minlength=4).tolist()
 
     @generate_chart(
         bars=[
@@ -870,26 +712,7 @@ class TimeFeature(BaseFeature):
         - Regular Interactions (60-120 seconds)
         - Late Interactions (>120 seconds)
         """
-        chat = self.chats[0]
-        data: DefaultDict[str, List[Message]] = defaultdict(list)
-
-        columns = [
-            'Super Fast Interactions', 'Fast Interactions',
-            'Regular Interactions', 'Late Interactions',
-            'Qty_messages'
-        ]
-        rows: List[List[int]] = []
-
-        for message in chat.messages:
-            data[message.created_at.strftime('%B %Y')].append(message)
-
-        index = list(data.keys())
-
-        for messages in data.values():
-            interactions = self.get_interation_timings(messages)
-            rows.append([*interactions, len(messages)])
-
-        return DataFrame(rows, index=index, columns=columns)
+        return _count_interactions_by(self.chats[0], 'month')
 
     @generate_chart(
         bars=[
@@ -909,32 +732,206 @@ class TimeFeature(BaseFeature):
         - Regular Interactions (60-120 seconds)
         - Late Interactions (>120 seconds)
         """
-        chat = self.chats[0]
-        data: Dict[str, List[Message]] = {w: [] for w in WEEKDAYS}
+        return _count_interactions_by(self.chats[0], 'weekday')
+
+
+SPACY_MODEL = 'pt_core_news_sm'
+
+# The pipeline components whose output is not used by the features.
+UNUSED_PIPES = ('parser', 'ner', 'lemmatizer')
+
+# The number of texts spaCy tags at a time.
+SPACY_BATCH_SIZE = 1000
+
+# The number of processes spaCy tags with. Multiprocessing is opt-in,
+# since starting the workers is slow and it behaves differently on
+# Windows.
+SPACY_PROCESSES = 1
+
+# Whether spaCy should tag on the GPU when one is available. It falls
+# back to the CPU otherwise.
+SPACY_GPU = False
+
+TRUTHY = ('1', 'true', 'yes', 'on')
+FALSY = ('0', 'false', 'no', 'off', '')
 
-        columns = [
-            'Super Fast Interactions', 'Fast Interactions',
-            'Regular Interactions', 'Late Interactions',
-            'Qty_messages'
-        ]
-        rows: List[List[int]] = []
 
-        for message in chat.messages:
-            data[message.created_at.strftime('%A')].append(message)
+def _get_flag(name: str, default: bool) -> bool:
+    # The environment is only read when the setting is needed, so an
+    # invalid value never breaks importing Qualichat.
+    value = os.environ.get(name)
 
-        index = list(data.keys())
+    if value is None:
+        return default
 
-        for messages in data.values():
-            interactions = self.get_interation_timings(messages)
-            rows.append([*interactions, len(messages)])
+    if value.strip().lower() in TRUTHY:
+        return True
 
-        return DataFrame(rows, index=index, columns=columns)
+    if value.strip().lower() in FALSY:
+        return False
 
+    log('warning', f'Invalid value {value!r} for {name}, ' \
+                   f'using {default!r} instead.')
+    return default
 
-nlp = spacy.load('pt_core_news_sm') # type: ignore
 
+def _get_number(
+    name: str,
+    default: int,
+    is_valid: Callable[[int], bool]
+) -> int:
+    # Same as :func:`_get_flag`, for settings that are integers.
+    value = os.environ.get(name)
 
-class NounsFeature(BaseFeature):
+    if value is None:
+        return default
+
+    try:
+        number = int(value)
+    except ValueError:
+        pass
+    else:
+        if is_valid(number):
+            return number
+
+    log('warning', f'Invalid value {value!r} for {name}, ' \
+                   f'using {default!r} instead.')
+    return default
+
+
+@functools.lru_cache(maxsize=1)
+def _get_nlp(
+    model: str = SPACY_MODEL,
+    exclude: Tuple[str, ...] = UNUSED_PIPES,
+    gpu: bool = SPACY_GPU
+) -> Any:
+    # The model is only loaded when a feature first needs it, since
+    # loading it is slow and takes a lot of memory. Only one pipeline
+    # is kept in memory and it is shared by all the features.
+    if gpu:
+        # This has to be called before the model is loaded.
+        spacy.prefer_gpu() # type: ignore
+
+    return spacy.load(model, exclude=list(exclude)) # type: ignore
+
+
+def _get_texts(chat: Chat) -> Tuple[str, ...]:
+    return tuple(
+        message['Qty_char_text'] for message in chat.messages
+        if message['Type'] is MessageType.default
+    )
+
+
+def _merge_forms(counts: Dict[str, int]) -> Dict[str, int]:
+    # Same normalization :meth:`wordcloud.WordCloud.process_text` does:
+    # words differing only in case are merged into their most common
+    # spelling, and plurals ending in "s" are merged into their
+    # singular when it is also present.
+    forms: Dict[str, Dict[str, int]] = {}
+
+    for word, count in counts.items():
+        spellings = forms.setdefault(word.lower(), {})
+        spellings[word] = spellings.get(word, 0) + count
+
+    for key in list(forms):
+        if key.endswith('s') and not key.endswith('ss') and key[:-1] in forms:
+            singular = forms[key[:-1]]
+
+            for word, count in forms.pop(key).items():
+                singular[word[:-1]] = singular.get(word[:-1], 0) + count
+
+    merged: Dict[str, int] = {}
+
+    for spellings in forms.values():
+        word = max(spellings.items(), key=operator.itemgetter(1))[0]
+        merged[word] = sum(spellings.values())
+
+    return merged
+
+
+def _count_words(texts: Tuple[str, ...]) -> Dict[str, Dict[str, int]]:
+    # The words are counted as they are tagged, since the word cloud
+    # would otherwise join and tokenize them again. Stopwords have to
+    # be removed here for the same reason.
+    frequencies: Dict[str, Dict[str, int]] = {
+        'NOUN': Counter(),
+        'VERB': Counter()
+    }
+
+    # Chats repeat many short messages, so each distinct text is
+    # tagged only once and its words are counted once per copy.
+    occurrences = Counter(texts)
+    unique = list(occurrences)
+    batch_size = _get_number(
+        'QUALICHAT_SPACY_BATCH_SIZE', SPACY_BATCH_SIZE, lambda n: n > 0
+    )
+    # ``-1`` makes spaCy use all the CPU cores.
+    processes = _get_number(
+        'QUALICHAT_SPACY_PROCESSES', SPACY_PROCESSES,
+        lambda n: n > 0 or n == -1
+    )
+    gpu = _get_flag('QUALICHAT_SPACY_GPU', SPACY_GPU)
+
+    # spaCy can not fork workers once CUDA has been initialized.
+    if gpu and processes != 1:
+        log('warning', 'QUALICHAT_SPACY_PROCESSES can not be combined ' \
+                       'with QUALICHAT_SPACY_GPU, using 1 instead.')
+        processes = 1
+
+    nlp = _get_nlp(gpu=gpu)
+    docs = nlp.pipe(unique, batch_size=batch_size, n_process=processes)
+
+    # The tags are compared by their ids, which avoids building a
+    # string for the tag of every token.
+    tags = {nlp.vocab.strings[pos]: pos for pos in frequencies}
+    stopwords = _get_stopwords()
+
+    # The progress bar is only redrawn every 1% of the texts, since
+    # writing to the terminal is slow compared to tagging short texts.
+    total = len(unique)
+    step = max(total // 100, 1)
+
+    for i, (text, doc) in enumerate(zip(unique, docs), start=1):
+        amount = occurrences[text]
+
+        for token in doc: # type: ignore
+            pos = tags.get(token.pos) # type: ignore
+            word = token.text # type: ignore
+
+            if pos is not None and word.lower() not in stopwords:
+                frequencies[pos][word] += amount
+
+        if i % step == 0 or i == total:
+            progress_bar(i, total)
+
+    return {pos: _merge_forms(words) for pos, words in frequencies.items()}
+
+
+class _WordsFeature(BaseFeature):
+    # The base of the word cloud features. The texts are tagged only
+    # once per chat and both nouns and verbs are counted, so features
+    # given the same ``frequencies`` dict share the same run.
+
+    __slots__ = ('_frequencies',)
+
+    def __init__(
+        self,
+        chats: List[Chat],
+        frequencies: Optional[Dict[Chat, Dict[str, Dict[str, int]]]] = None
+    ) -> None:
+        super().__init__(chats)
+        self._frequencies = {} if frequencies is None else frequencies
+
+    def _get_frequencies(self, pos: str) -> Dict[str, int]:
+        chat = self.chats[0]
+
+        if chat not in self._frequencies:
+            self._frequencies[chat] = _count_words(_get_texts(chat))
+
+        return self._frequencies[chat][pos]
+
+
+class NounsFeature(_WordsFeature):
     """Textual structure analysis feature, specific for nouns.
     
     .. note::
@@ -950,31 +947,14 @@ class NounsFeature(BaseFeature):
     __slots__ = ()
 
     @generate_word_cloud()
-    def word_cloud(self) -> WordCloud: # type: ignore
+    def word_cloud(self) -> 'WordCloud': # type: ignore
         """Shows a word cloud with the most spoken nouns in the
         chat.
         """
-        chat = self.chats[0]
-        data: List[str] = []
+        return _get_word_cloud(self._get_frequencies('NOUN'))
 
-        for i, message in enumerate(chat.messages, start=1):
-            if message['Type'] is not MessageType.default:
-                continue
 
-            text = message['Qty_char_text']
-            doc = nlp(text) # type: ignore
-
-            for token in doc: # type: ignore
-                if token.pos_ == 'NOUN': # type: ignore
-                    data.append(token.text) # type: ignore
-
-            progress_bar(i, len(chat.messages))
-
-        all_words = ' '.join(data)
-        return WordCloud().generate(all_words) # type: ignore
-
-
-class VerbsFeature(BaseFeature):
+class VerbsFeature(_WordsFeature):
     """Textual structure analysis feature, specific for verbs.
     
     .. note::
@@ -990,28 +970,11 @@ class VerbsFeature(BaseFeature):
     __slots__ = ()
 
     @generate_word_cloud()
-    def word_cloud(self) -> WordCloud: # type: ignore
+    def word_cloud(self) -> 'WordCloud': # type: ignore
         """Shows a word cloud with the most spoken nouns in the
         chat.
         """
-        chat = self.chats[0]
-        data: List[str] = []
-
-        for i, message in enumerate(chat.messages, start=1):
-            if message['Type'] is not MessageType.default:
-                continue
-
-            text = message['Qty_char_text']
-            doc = nlp(text) # type: ignore
-
-            for token in doc: # type: ignore
-                if token.pos_ == 'VERB': # type: ignore
-                    data.append(token.text) # type: ignore
-
-            progress_bar(i, len(chat.messages))
-
-        all_words = ' '.join(data)
-        return WordCloud().generate(all_words) # type: ignore
+        return _get_word_cloud(self._get_frequencies('VERB'))
 
 
 class EmojisFeature(BaseFeature):
@@ -1037,17 +1000,19 @@ class EmojisFeature(BaseFeature):
         columns = ['Qty_char_emoji', 'Qty_messages']
         index = [actor.display_name for actor in chat.actors]
 
-        rows: List[List[int]] = []
-
-        for actor in chat.actors:
-            emojis = 0
-            messages = 0
+        frame = chat.to_frame()
+        actors = frame['actor'].to_numpy()
 
-            for message in actor.messages:
-                emojis += len(message['Qty_char_emoji'])
-                messages += 1
+        # Every message is counted here, and its emojis are counted
+        # instead of their characters.
+        emojis = np.bincount(
+            actors, weights=frame['emojis'], minlength=len(index)
+        ).astype(np.int64)
+        messages = np.bincount(actors, minlength=len(index))
 
-            rows.append([emojis, messages])
+        dataframe = DataFrame(
+            {'Qty_char_emoji': emojis, 'Qty_messages': messages},
+            index=index
+        )
 
-        dataframe = DataFrame(rows, index=index, columns=columns)
-        return dataframe.sort_values(by=columns, ascending=False)[start:end]
+        return dataframe.nlargest(end, columns).iloc[start:] # type: ignore
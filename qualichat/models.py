@@ -23,7 +23,8 @@ SOFTWARE.
 '''
 
 import datetime
-from typing import List, Dict, Any, Iterable
+import functools
+from typing import List, Dict, Any, Iterable, Tuple, Union
 from types import MappingProxyType
 
 import emojis # type: ignore
@@ -46,9 +47,14 @@ __all__ = ('Actor', 'Message', 'SystemMessage')
 
 TIME_FORMAT = r'%d/%m/%y %H:%M:%S'
 
+@functools.lru_cache(maxsize=4096)
 def parse_time(string: str) -> datetime.datetime:
     """Converts the message creation time string to a
     :class:`datetime.datetime` object.
+
+    Results are cached, so messages sent within the same second share
+    the same :class:`datetime.datetime` object. This is safe because
+    datetimes are immutable.
     
     Parameters
     ----------
@@ -64,6 +70,13 @@ def parse_time(string: str) -> datetime.datetime:
     return datetime.datetime.strptime(string, TIME_FORMAT)
 
 
+def _get_length(obj: Union[str, List[str]]) -> int:
+    if isinstance(obj, str):
+        return len(obj)
+
+    return sum(map(len, obj))
+
+
 def _remove_all_incidences(text: str, *iterables: Iterable[str]) -> str:
     for iterable in iterables:
         for incidence in iterable:
@@ -199,12 +212,15 @@ class Message(BaseMessage):
         The message's creation time.
     """
 
-    __slots__ = ('actor', 'content', 'created_at', '_data')
+    __slots__ = ('actor', '_data', '_lengths')
+
+    actor: Actor
+    _data: 'MappingProxyType[str, Any]'
+    _lengths: Dict[str, int]
 
     def __init__(self, actor: Actor, content: str, created_at: str) -> None:
-        self.actor: Actor = actor
-        self.content: str = content
-        self.created_at: datetime.datetime = parse_time(created_at)
+        object.__setattr__(self, 'actor', actor)
+        super().__init__(content, parse_time(created_at))
 
         data: Dict[str, Any] = {}
         data['Qty_char_total'] = len(self.content)
@@ -256,18 +272,54 @@ class Message(BaseMessage):
         data['Day_period'] = get_period(self.created_at)
         data['Day_sub_period'] = get_sub_period(self.created_at)
 
-        self._data: MappingProxyType[str, Any] = MappingProxyType(data)
+        object.__setattr__(self, '_data', MappingProxyType(data))
+
+        # Charts only need the number of characters of each data, so
+        # they are computed once here instead of on every chart.
+        lengths = {
+            key: _get_length(value) for key, value in data.items()
+            if isinstance(value, (str, list))
+        }
+        object.__setattr__(self, '_lengths', lengths)
 
     def __repr__(self) -> str:
         return '<Message actor={0.actor} ' \
                'created_at={0.created_at!r}>'.format(self)
 
+    def _key(self) -> Tuple[Any, ...]:
+        return (self.actor, self.content, self.created_at)
+
     def __getitem__(self, key: Any) -> Any:
         if not isinstance(key, str):
             raise TypeError('indices must be strings')
 
         return self._data[key]
 
+    def length(self, key: str) -> int:
+        """Returns the number of characters of the given message data,
+        e.g. ::
+
+            message.length('Qty_char_laughs')
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The name of the message data. Only data made of strings
+            (such as ``Qty_char_net`` or ``Qty_char_emoji``) is
+            supported.
+
+        Returns
+        -------
+        :class:`int`
+            The total number of characters of the data.
+
+        Raises
+        ------
+        :class:`KeyError`
+            The data does not exist or is not made of strings.
+        """
+        return self._lengths[key]
+
 
 class SystemMessage(BaseMessage):
     """Represents a message sent in the chat by the system.
@@ -280,11 +332,10 @@ class SystemMessage(BaseMessage):
         The message's creation time.
     """
 
-    __slots__ = ('content', 'created_at')
+    __slots__ = ()
 
     def __init__(self, content: str, created_at: str) -> None:
-        self.content: str = content
-        self.created_at: datetime.datetime = parse_time(created_at)
+        super().__init__(content, parse_time(created_at))
 
     def __repr__(self) -> str:
         return '<SystemMessage created_at={0.created_at!r}>'.format(self)